@@ -246,7 +246,10 @@ export async function POST(request: NextRequest) {
             });
 
             try {
-              const { buffer } = await downloadDriveFile(file.id);
+              const { buffer } = await downloadDriveFile(
+                file.id,
+                file.mimeType,
+              );
               const revResult = await performRevolutionaryGapAnalysis(
                 { id: file.id, name: file.name, buffer },
                 anthropicApiKey,
@@ -449,7 +452,10 @@ export async function POST(request: NextRequest) {
       const slice = pdfFiles.slice(i, i + DOWNLOAD_CONCURRENCY);
       const batch = await Promise.all(
         slice.map(async (file) => {
-          const { buffer } = await downloadDriveFile(file.id);
+          const { buffer } = await downloadDriveFile(
+            file.id,
+            file.mimeType,
+          );
           return { id: file.id, name: file.name, buffer };
         }),
       );
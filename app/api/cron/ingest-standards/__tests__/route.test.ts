@@ -9,29 +9,33 @@ import { describe, expect, it, vi, beforeEach } from "vitest";
 import { NextRequest } from "next/server";
 
 const {
-  upsertChunkMock,
+  executeRawUnsafeMock,
+  queryRawUnsafeMock,
   embedBatchMock,
   queryRawMock,
   retrieveForCitationMock,
   retrieveForReasoningMock,
 } = vi.hoisted(() => ({
-  upsertChunkMock: vi.fn(),
+  executeRawUnsafeMock: vi.fn(),
+  queryRawUnsafeMock: vi.fn(),
   embedBatchMock: vi.fn(),
   queryRawMock: vi.fn(),
   retrieveForCitationMock: vi.fn(),
   retrieveForReasoningMock: vi.fn(),
 }));
 
-vi.mock("@/lib/prisma", () => ({ prisma: { $queryRaw: queryRawMock } }));
+vi.mock("@/lib/prisma", () => ({
+  prisma: {
+    $queryRaw: queryRawMock,
+    $executeRawUnsafe: executeRawUnsafeMock,
+    $queryRawUnsafe: queryRawUnsafeMock,
+  },
+}));
 vi.mock("@/lib/rag/embed", () => ({ embedBatch: embedBatchMock }));
 vi.mock("@/lib/rag/retrieve", () => ({
   retrieveForCitation: retrieveForCitationMock,
   retrieveForReasoning: retrieveForReasoningMock,
 }));
-vi.mock("@/scripts/ingest-iicrc", async (importOriginal) => {
-  const actual = await importOriginal<typeof import("@/scripts/ingest-iicrc")>();
-  return { ...actual, upsertChunk: upsertChunkMock };
-});
 
 import { GET, POST } from "@/app/api/cron/ingest-standards/route";
 
@@ -60,7 +64,12 @@ beforeEach(() => {
   embedBatchMock.mockImplementation(async (texts: string[]) =>
     texts.map(() => Array(1536).fill(0.1)),
   );
-  upsertChunkMock.mockResolvedValue("inserted");
+  // Nothing stored yet — findExistingHashes reports no existing chunks.
+  queryRawUnsafeMock.mockResolvedValue([]);
+  // Every row in the batched INSERT lands (10 bound values per row).
+  executeRawUnsafeMock.mockImplementation(
+    async (_sql: string, ...values: unknown[]) => values.length / 10,
+  );
 });
 
 describe("POST /api/cron/ingest-standards", () => {
@@ -68,19 +77,19 @@ describe("POST /api/cron/ingest-standards", () => {
     delete process.env.STANDARDS_INGEST_TOKEN;
     const res = await POST(buildRequest("Bearer ", VALID_BODY));
     expect(res.status).toBe(401);
-    expect(upsertChunkMock).not.toHaveBeenCalled();
+    expect(executeRawUnsafeMock).not.toHaveBeenCalled();
   });
 
   it("rejects a missing bearer", async () => {
     const res = await POST(buildRequest(null, VALID_BODY));
     expect(res.status).toBe(401);
-    expect(upsertChunkMock).not.toHaveBeenCalled();
+    expect(executeRawUnsafeMock).not.toHaveBeenCalled();
   });
 
   it("rejects a wrong bearer", async () => {
     const res = await POST(buildRequest("Bearer wrong", VALID_BODY));
     expect(res.status).toBe(401);
-    expect(upsertChunkMock).not.toHaveBeenCalled();
+    expect(executeRawUnsafeMock).not.toHaveBeenCalled();
   });
 
   it("rejects an invalid body with 400", async () => {
@@ -88,7 +97,7 @@ describe("POST /api/cron/ingest-standards", () => {
       buildRequest("Bearer test-ingest-token", { standard: "S500" }),
     );
     expect(res.status).toBe(400);
-    expect(upsertChunkMock).not.toHaveBeenCalled();
+    expect(executeRawUnsafeMock).not.toHaveBeenCalled();
   });
 
   it("ingests a valid body and reports the summary shape", async () => {
@@ -102,15 +111,28 @@ describe("POST /api/cron/ingest-standards", () => {
     });
     expect(json.chunksUpserted).toBeGreaterThan(0);
     expect(embedBatchMock).toHaveBeenCalled();
-    expect(upsertChunkMock).toHaveBeenCalledWith(
-      expect.anything(),
-      expect.objectContaining({
-        standard: "S500",
-        edition: "2021",
-        provenance: "AUTHORITATIVE_STANDARD",
-        jurisdiction: "AU",
-      }),
+    // One multi-row INSERT per embedding batch, not one per chunk.
+    expect(executeRawUnsafeMock).toHaveBeenCalledTimes(1);
+    const values = executeRawUnsafeMock.mock.calls[0].slice(1);
+    expect(json.chunksUpserted).toBe(values.length / 10);
+    expect(values.slice(0, 2)).toEqual(["S500", "2021"]);
+    expect(values.slice(8, 10)).toEqual(["AUTHORITATIVE_STANDARD", "AU"]);
+  });
+
+  it("skips embedding and writing chunks that are already stored", async () => {
+    queryRawUnsafeMock.mockImplementation(
+      async (_sql: string, hashes: string[]) =>
+        hashes.map((contentHash) => ({ contentHash })),
     );
+
+    const res = await POST(buildRequest("Bearer test-ingest-token", VALID_BODY));
+    expect(res.status).toBe(200);
+    const json = await res.json();
+    expect(json.chunksUpserted).toBe(0);
+    expect(json.chunksSkipped).toBeGreaterThan(0);
+    expect(queryRawUnsafeMock).toHaveBeenCalledTimes(1);
+    expect(embedBatchMock).not.toHaveBeenCalled();
+    expect(executeRawUnsafeMock).not.toHaveBeenCalled();
   });
 });
 
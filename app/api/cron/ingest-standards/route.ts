@@ -26,10 +26,7 @@ import { z } from "zod";
 import { prisma } from "@/lib/prisma";
 import {
   chunkText,
-  extractSection,
-  buildContentHash,
-  upsertChunk,
-  assertEmbeddingShape,
+  ingestChunkBatch,
   parseProvenance,
 } from "@/scripts/ingest-iicrc";
 // Type-only import: erased at compile time, so it does NOT eagerly load
@@ -117,26 +114,15 @@ export async function POST(request: NextRequest) {
     for (const file of files) {
       const chunks = chunkText(file.text);
       for (let i = 0; i < chunks.length; i += BATCH) {
-        const batch = chunks.slice(i, i + BATCH);
-        const embeddings = await embedBatch(batch);
-        assertEmbeddingShape(embeddings, batch.length);
-
-        for (let j = 0; j < batch.length; j++) {
-          const content = batch[j];
-          const result = await upsertChunk(prisma, {
-            standard,
-            edition,
-            ...extractSection(content),
-            content,
-            contentHash: buildContentHash(standard, edition, content),
-            pageNumber: Math.floor((i + j) / 2) + 1,
-            embedding: embeddings[j],
-            provenance,
-            jurisdiction,
-          });
-          if (result === "inserted") summary.chunksUpserted++;
-          else summary.chunksSkipped++;
-        }
+        const { inserted, skipped } = await ingestChunkBatch(
+          prisma,
+          chunks.slice(i, i + BATCH),
+          i,
+          { standard, edition, provenance, jurisdiction },
+          embedBatch,
+        );
+        summary.chunksUpserted += inserted;
+        summary.chunksSkipped += skipped;
       }
       summary.filesProcessed++;
     }
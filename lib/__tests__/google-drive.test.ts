@@ -0,0 +1,138 @@
+/**
+ * lib/google-drive.ts — Drive API call shapes (googleapis mocked).
+ */
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+
+const { filesList, filesGet, filesExport } = vi.hoisted(() => ({
+  filesList: vi.fn(),
+  filesGet: vi.fn(),
+  filesExport: vi.fn(),
+}));
+
+vi.mock("googleapis", () => ({
+  google: {
+    drive: vi.fn(() => ({
+      files: { list: filesList, get: filesGet, export: filesExport },
+    })),
+  },
+}));
+vi.mock("google-auth-library", () => ({
+  JWT: vi.fn(),
+}));
+
+import { downloadDriveFile, searchDriveFiles } from "../google-drive";
+
+describe("google-drive", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.stubEnv("GOOGLE_CLIENT_EMAIL", "svc@example.iam.gserviceaccount.com");
+    vi.stubEnv("GOOGLE_PRIVATE_KEY", "test-key");
+  });
+
+  afterEach(() => {
+    vi.unstubAllEnvs();
+  });
+
+  it("reuses one authenticated Drive client across calls", async () => {
+    vi.resetModules();
+    const { JWT } = await import("google-auth-library");
+    const drive = await import("../google-drive");
+    filesList.mockResolvedValue({ data: { files: [] } });
+
+    await drive.searchDriveFiles("S500");
+    await drive.searchDriveFiles("S520");
+
+    expect(JWT).toHaveBeenCalledTimes(1);
+    expect(filesList).toHaveBeenCalledTimes(2);
+  });
+
+  describe("searchDriveFiles", () => {
+    it("follows nextPageToken instead of truncating at the first page", async () => {
+      filesList
+        .mockResolvedValueOnce({
+          data: {
+            files: [
+              { id: "1", name: "S500 a.pdf", mimeType: "application/pdf" },
+            ],
+            nextPageToken: "page-2",
+          },
+        })
+        .mockResolvedValueOnce({
+          data: {
+            files: [
+              { id: "2", name: "S500 b.pdf", mimeType: "application/pdf" },
+            ],
+          },
+        });
+
+      const files = await searchDriveFiles("S500");
+
+      expect(files.map((f) => f.id)).toEqual(["1", "2"]);
+      expect(filesList).toHaveBeenCalledTimes(2);
+      expect(filesList.mock.calls[1][0]).toMatchObject({ pageToken: "page-2" });
+    });
+
+    it("matches several keywords in a single files.list query", async () => {
+      filesList.mockResolvedValueOnce({ data: { files: [] } });
+
+      await searchDriveFiles(["S500", "IICRC's S500"], undefined, "folder-1");
+
+      expect(filesList).toHaveBeenCalledTimes(1);
+      expect(filesList.mock.calls[0][0].q).toBe(
+        "trashed=false and (name contains 'S500' or name contains 'IICRC\\'s S500')" +
+          " and 'folder-1' in parents",
+      );
+    });
+
+    it("returns nothing without querying Drive when given no keywords", async () => {
+      expect(await searchDriveFiles([])).toEqual([]);
+      expect(filesList).not.toHaveBeenCalled();
+    });
+  });
+
+  describe("downloadDriveFile", () => {
+    it("looks up the MIME type when the caller doesn't know it", async () => {
+      filesGet
+        .mockResolvedValueOnce({ data: { mimeType: "application/pdf" } })
+        .mockResolvedValueOnce({ data: new ArrayBuffer(4) });
+
+      const result = await downloadDriveFile("file-1");
+
+      expect(result.mimeType).toBe("application/pdf");
+      expect(filesGet).toHaveBeenCalledTimes(2);
+      expect(filesGet.mock.calls[0][0]).toEqual({
+        fileId: "file-1",
+        fields: "mimeType",
+      });
+    });
+
+    it("skips the metadata round-trip when the MIME type is already known", async () => {
+      filesGet.mockResolvedValueOnce({ data: new ArrayBuffer(4) });
+
+      const result = await downloadDriveFile("file-1", "application/pdf");
+
+      expect(result.mimeType).toBe("application/pdf");
+      expect(filesGet).toHaveBeenCalledTimes(1);
+      expect(filesGet.mock.calls[0][0]).toEqual({
+        fileId: "file-1",
+        alt: "media",
+      });
+    });
+
+    it("exports Google Docs as plain text using the known MIME type", async () => {
+      filesExport.mockResolvedValueOnce({ data: new ArrayBuffer(4) });
+
+      const result = await downloadDriveFile(
+        "doc-1",
+        "application/vnd.google-apps.document",
+      );
+
+      expect(result.mimeType).toBe("text/plain");
+      expect(filesGet).not.toHaveBeenCalled();
+      expect(filesExport.mock.calls[0][0]).toEqual({
+        fileId: "doc-1",
+        mimeType: "text/plain",
+      });
+    });
+  });
+});
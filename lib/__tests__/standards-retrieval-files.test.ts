@@ -0,0 +1,93 @@
+/**
+ * Per-file processing in retrieveRelevantStandards — files are downloaded and
+ * AI-extracted in bounded parallel batches, but the returned documents must
+ * keep relevance order and a single failing file must not abort the rest.
+ */
+import { describe, it, expect, vi, beforeEach } from "vitest";
+
+const {
+  listDriveItems,
+  searchDriveFiles,
+  downloadDriveFile,
+  extractTextFromTXT,
+  analyzeStandardsFolder,
+  extractStandardsSections,
+} = vi.hoisted(() => ({
+  listDriveItems: vi.fn(),
+  searchDriveFiles: vi.fn(),
+  downloadDriveFile: vi.fn(),
+  extractTextFromTXT: vi.fn(),
+  analyzeStandardsFolder: vi.fn(),
+  extractStandardsSections: vi.fn(),
+}));
+
+vi.mock("../observability", () => ({ reportError: vi.fn() }));
+vi.mock("../google-drive", () => ({
+  getStandardsFolderId: () => "folder-id",
+  listDriveItems,
+  searchDriveFiles,
+  downloadDriveFile,
+}));
+vi.mock("../file-extraction", () => ({
+  extractTextFromPDF: vi.fn(),
+  extractTextFromDOCX: vi.fn(),
+  extractTextFromTXT,
+}));
+vi.mock("../services/ai/standards/analyze-standards-folder", () => ({
+  analyzeStandardsFolder,
+}));
+vi.mock("../services/ai/standards/extract-standards-sections", () => ({
+  extractStandardsSections,
+}));
+
+import { retrieveRelevantStandards } from "../standards-retrieval";
+
+const txt = (id: string, name: string) => ({
+  id,
+  name,
+  mimeType: "text/plain",
+});
+
+describe("retrieveRelevantStandards per-file processing", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    searchDriveFiles.mockResolvedValue([]);
+    analyzeStandardsFolder.mockResolvedValue({
+      ok: true,
+      data: { relevantFiles: [], reasoning: "" },
+    });
+    extractTextFromTXT.mockImplementation(async (buffer: Buffer) =>
+      buffer.toString("utf-8"),
+    );
+    extractStandardsSections.mockImplementation(async ({ fileName }) => ({
+      ok: true,
+      data: { sections: [`section from ${fileName}`] },
+    }));
+  });
+
+  it("keeps relevance order and skips files that fail to download", async () => {
+    const files = [
+      txt("a", "IICRC S500 water.txt"),
+      txt("b", "S500 notes.txt"),
+      txt("c", "general.txt"),
+      txt("d", "other.txt"),
+      txt("e", "misc.txt"),
+    ];
+    listDriveItems.mockResolvedValue({ files, folders: [] });
+    downloadDriveFile.mockImplementation(async (id: string) => {
+      if (id === "b") throw new Error("Drive 500");
+      // Resolve later files first to prove ordering isn't completion order.
+      await new Promise((r) => setTimeout(r, id === "a" ? 20 : 0));
+      return { buffer: Buffer.from("x".repeat(200)), mimeType: "text/plain" };
+    });
+
+    const ctx = await retrieveRelevantStandards(
+      { reportType: "water" },
+      "sk-ant-test",
+    );
+
+    expect(ctx.degraded).toBe(false);
+    expect(ctx.documents.map((d) => d.fileId)).toEqual(["a", "c", "d", "e"]);
+    expect(downloadDriveFile).toHaveBeenCalledTimes(5);
+  });
+});
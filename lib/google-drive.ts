@@ -6,10 +6,18 @@
  */
 
 import { google } from "googleapis";
+import type { drive_v3 } from "googleapis";
 import { JWT } from "google-auth-library";
 
+// One client per process: the JWT caches its access token and the underlying
+// agent keeps connections alive, so reusing it avoids a token exchange and a
+// fresh TLS handshake on every Drive call.
+let cachedDriveClient: drive_v3.Drive | null = null;
+
 // Initialize Google Drive client with service account
-function getDriveClient() {
+function getDriveClient(): drive_v3.Drive {
+  if (cachedDriveClient) return cachedDriveClient;
+
   const credentials = {
     type: "service_account",
     project_id: process.env.GOOGLE_PROJECT_ID,
@@ -38,7 +46,8 @@ function getDriveClient() {
     ],
   });
 
-  return google.drive({ version: "v3", auth });
+  cachedDriveClient = google.drive({ version: "v3", auth });
+  return cachedDriveClient;
 }
 
 export interface DriveFile {
@@ -137,20 +146,30 @@ export async function listDriveItems(
 
 /**
  * Search for files in Google Drive by keyword
+ *
+ * Pass several keywords to match any of them in a single query (one
+ * files.list round-trip instead of one per keyword).
  */
 export async function searchDriveFiles(
-  keyword: string,
+  keyword: string | string[],
   mimeTypes?: string[],
   folderId?: string,
 ): Promise<DriveFile[]> {
+  const keywords = Array.isArray(keyword) ? keyword : [keyword];
+  if (keywords.length === 0) {
+    return [];
+  }
+
   try {
     const drive = getDriveClient();
 
-    // Escape single quotes in keyword for query safety
-    const escapedKeyword = keyword.replace(/'/g, "\\'");
+    // Escape single quotes in keywords for query safety
+    const nameQuery = keywords
+      .map((kw) => `name contains '${kw.replace(/'/g, "\\'")}'`)
+      .join(" or ");
 
     // Build query - only use name contains (fullText requires different permissions and can cause errors)
-    let query = `trashed=false and name contains '${escapedKeyword}'`;
+    let query = `trashed=false and (${nameQuery})`;
 
     // If folderId is provided, search within that folder
     if (folderId) {
@@ -165,27 +184,37 @@ export async function searchDriveFiles(
       query += ` and (${mimeTypeQuery})`;
     }
 
-    const response = await drive.files.list({
-      q: query,
-      fields: "files(id, name, mimeType, size)",
-      pageSize: 50,
-      orderBy: "name", // Changed from 'relevance' as it may not be supported
-    });
+    // Follow nextPageToken so matches beyond the first page aren't silently
+    // dropped (same pattern as listDriveItems).
+    const files: DriveFile[] = [];
+    let nextPageToken: string | undefined;
 
-    if (!response.data.files) {
-      return [];
-    }
+    do {
+      const response = await drive.files.list({
+        q: query,
+        fields: "nextPageToken, files(id, name, mimeType, size)",
+        pageSize: 1000,
+        pageToken: nextPageToken,
+        orderBy: "name", // Changed from 'relevance' as it may not be supported
+      });
+
+      for (const file of response.data.files ?? []) {
+        files.push({
+          id: file.id!,
+          name: file.name!,
+          mimeType: file.mimeType!,
+          size: file.size ?? undefined,
+        });
+      }
+
+      nextPageToken = response.data.nextPageToken || undefined;
+    } while (nextPageToken);
 
-    return response.data.files.map((file) => ({
-      id: file.id!,
-      name: file.name!,
-      mimeType: file.mimeType!,
-      size: file.size ?? undefined,
-    }));
+    return files;
   } catch (error: any) {
     // Log the actual error for debugging
     console.error(
-      `[Google Drive Search] Error searching for "${keyword}":`,
+      `[Google Drive Search] Error searching for "${keywords.join('", "')}":`,
       error.message,
     );
     // Return empty array instead of throwing to allow graceful degradation
@@ -196,20 +225,26 @@ export async function searchDriveFiles(
 /**
  * Download a file from Google Drive
  * Returns buffer and mimeType
+ *
+ * Pass `knownMimeType` when the caller already has it from a listing
+ * (listDriveItems / searchDriveFiles) to skip the metadata round-trip.
  */
 export async function downloadDriveFile(
   fileId: string,
+  knownMimeType?: string,
 ): Promise<{ buffer: Buffer; mimeType: string }> {
   try {
     const drive = getDriveClient();
 
-    // Get file metadata
-    const fileMetadata = await drive.files.get({
-      fileId,
-      fields: "name, mimeType, size",
-    });
-
-    const mimeType = fileMetadata.data.mimeType || "application/octet-stream";
+    // Get file metadata — only the MIME type is needed (download vs export)
+    let mimeType = knownMimeType;
+    if (!mimeType) {
+      const fileMetadata = await drive.files.get({
+        fileId,
+        fields: "mimeType",
+      });
+      mimeType = fileMetadata.data.mimeType || "application/octet-stream";
+    }
 
     // Handle Google Workspace files (Docs, Sheets, etc.) - export as text
     let exportMimeType = mimeType;
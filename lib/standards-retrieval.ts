@@ -44,6 +44,11 @@ import { reportError } from "./observability";
 // from '@/lib/standards-retrieval'`) keep working.
 export type { StandardsContext, RetrievalQuery };
 
+type StandardsDocument = StandardsContext["documents"][number];
+
+// Max standards files downloaded + AI-extracted at once.
+const FILE_CONCURRENCY = 4;
+
 /**
  * Build a degraded StandardsContext AND emit a loud, queryable ops alert.
  *
@@ -73,33 +78,54 @@ function resolveAnthropicApiKey(apiKey?: string): string | null {
   return key || null;
 }
 
+/**
+ * Query-derived match terms, lowercased once per retrieval so scoring a large
+ * folder listing doesn't rebuild them for every file.
+ */
+interface RelevanceTerms {
+  reportType: RetrievalQuery["reportType"];
+  standards: string[];
+  materials: string[];
+  keywords: string[];
+}
+
+function buildRelevanceTerms(query: RetrievalQuery): RelevanceTerms {
+  const lower = (values?: string[]) =>
+    (values ?? []).map((v) => v.toLowerCase());
+  return {
+    reportType: query.reportType,
+    standards: lower(determineRelevantStandards(query)),
+    materials: lower(query.materials),
+    keywords: lower(query.keywords),
+  };
+}
+
 /**
  * Calculate relevance score for a file based on filename and query
  */
 function calculateRelevanceScore(
   fileName: string,
-  query: RetrievalQuery,
+  terms: RelevanceTerms,
 ): number {
   let score = 0;
   const lowerFileName = fileName.toLowerCase();
-  const relevantStandards = determineRelevantStandards(query);
 
   // Check for standard type matches
-  relevantStandards.forEach((standard) => {
-    if (lowerFileName.includes(standard.toLowerCase())) {
+  for (const standard of terms.standards) {
+    if (lowerFileName.includes(standard)) {
       score += 15;
     }
-  });
+  }
 
   // Report type matching
   if (
-    query.reportType === "water" &&
+    terms.reportType === "water" &&
     (lowerFileName.includes("s500") || lowerFileName.includes("water"))
   ) {
     score += 20;
   }
   if (
-    query.reportType === "mould" &&
+    terms.reportType === "mould" &&
     (lowerFileName.includes("s520") ||
       lowerFileName.includes("mould") ||
       lowerFileName.includes("mold"))
@@ -107,28 +133,24 @@ function calculateRelevanceScore(
     score += 20;
   }
   if (
-    query.reportType === "commercial" &&
+    terms.reportType === "commercial" &&
     (lowerFileName.includes("s400") || lowerFileName.includes("commercial"))
   ) {
     score += 20;
   }
 
   // Material matching
-  if (query.materials) {
-    query.materials.forEach((material) => {
-      if (lowerFileName.includes(material.toLowerCase())) {
-        score += 5;
-      }
-    });
+  for (const material of terms.materials) {
+    if (lowerFileName.includes(material)) {
+      score += 5;
+    }
   }
 
   // Keyword matching
-  if (query.keywords) {
-    query.keywords.forEach((keyword) => {
-      if (lowerFileName.includes(keyword.toLowerCase())) {
-        score += 3;
-      }
-    });
+  for (const keyword of terms.keywords) {
+    if (lowerFileName.includes(keyword)) {
+      score += 3;
+    }
   }
 
   // Prefer files in specific standard folders
@@ -170,6 +192,76 @@ function extractStandardType(fileName: string): string {
   return "General";
 }
 
+/**
+ * Download one standards file, extract its text and pull the relevant
+ * sections via AI. Returns null when the file is unreadable, too short or
+ * yields no sections — a single bad file never aborts the whole retrieval.
+ */
+async function extractStandardsDocument(
+  file: DriveFile,
+  apiKey: string,
+  query: RetrievalQuery,
+): Promise<StandardsDocument | null> {
+  try {
+    const { buffer, mimeType } = await downloadDriveFile(
+      file.id,
+      file.mimeType,
+    );
+
+    // Extract text based on file type
+    let extractedText = "";
+    if (mimeType === "application/pdf" || file.mimeType === "application/pdf") {
+      extractedText = await extractTextFromPDF(buffer);
+    } else if (
+      mimeType ===
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document" ||
+      file.mimeType ===
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    ) {
+      extractedText = await extractTextFromDOCX(buffer);
+    } else if (mimeType === "text/plain" || file.mimeType === "text/plain") {
+      extractedText = await extractTextFromTXT(buffer);
+    } else {
+      extractedText = buffer.toString("utf-8");
+    }
+
+    if (!extractedText || extractedText.trim().length < 100) {
+      return null;
+    }
+
+    // Use the service module to extract relevant sections via AI.
+    const sectionsResult = await extractStandardsSections({
+      apiKey,
+      documentText: extractedText,
+      fileName: file.name,
+      query,
+    });
+    // Service returns ok() with a single fallback sentence on gateway
+    // failure — that preserves the legacy behaviour.
+    const relevantSections = sectionsResult.ok
+      ? sectionsResult.data.sections
+      : [];
+
+    if (relevantSections.length === 0) {
+      return null;
+    }
+
+    return {
+      name: file.name,
+      fileId: file.id,
+      relevantSections,
+      standardType: extractStandardType(file.name),
+      extractedContent: extractedText.substring(0, 5000),
+    };
+  } catch (error: any) {
+    console.error(
+      `[Standards Retrieval] Error processing file ${file.name}:`,
+      error.message,
+    );
+    return null;
+  }
+}
+
 /**
  * Retrieve relevant standards from Google Drive
  * Uses folder: IICRC Standards (1lFqpslQZ0kGovGh6WiHhgC3_gs9Rzbl1)
@@ -222,30 +314,29 @@ export async function retrieveRelevantStandards(
       const otherFiles = allFiles.filter((f) => !aiFileIds.has(f.id));
       allFiles = [...aiAnalysis.relevantFiles, ...otherFiles];
 
-      // Also search for relevant files by keywords (as backup) - search within the standards folder
-      const relevantStandards = determineRelevantStandards(query);
-      for (const standard of relevantStandards.slice(0, 3)) {
-        try {
-          const searchResults = await searchDriveFiles(
-            standard,
-            [
-              "application/pdf",
-              "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-              "text/plain",
-            ],
-            standardsFolderId, // Search within the standards folder
-          );
-          for (const file of searchResults) {
-            if (!allFiles.find((f) => f.id === file.id)) {
-              allFiles.push(file);
-            }
+      // Also search for relevant files by keywords (as backup) - search within the standards folder.
+      // One combined query covers all keywords instead of a round-trip each.
+      const relevantStandards = determineRelevantStandards(query).slice(0, 3);
+      try {
+        const searchResults = await searchDriveFiles(
+          relevantStandards,
+          [
+            "application/pdf",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "text/plain",
+          ],
+          standardsFolderId, // Search within the standards folder
+        );
+        for (const file of searchResults) {
+          if (!allFiles.find((f) => f.id === file.id)) {
+            allFiles.push(file);
           }
-        } catch (error: any) {
-          console.error(
-            `[Standards Retrieval] Error searching for "${standard}":`,
-            error.message,
-          );
         }
+      } catch (error: any) {
+        console.error(
+          `[Standards Retrieval] Error searching for "${relevantStandards.join('", "')}":`,
+          error.message,
+        );
       }
     } catch (error: any) {
       console.error(
@@ -266,9 +357,10 @@ export async function retrieveRelevantStandards(
     }
 
     // Score and rank files by relevance
+    const relevanceTerms = buildRelevanceTerms(query);
     const scoredFiles = allFiles.map((file) => ({
       file,
-      score: calculateRelevanceScore(file.name, query),
+      score: calculateRelevanceScore(file.name, relevanceTerms),
     }));
 
     // Remove duplicates by file ID
@@ -286,76 +378,17 @@ export async function retrieveRelevantStandards(
       .slice(0, 12)
       .map((item) => item.file);
 
-    // Extract text and relevant sections from top files
-    // Process files sequentially to avoid overwhelming the API
-    const documentsWithSections = [];
-    for (const file of topFiles) {
-      try {
-        const { buffer, mimeType } = await downloadDriveFile(file.id);
-
-        // Extract text based on file type
-        let extractedText = "";
-        if (
-          mimeType === "application/pdf" ||
-          file.mimeType === "application/pdf"
-        ) {
-          extractedText = await extractTextFromPDF(buffer);
-        } else if (
-          mimeType ===
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document" ||
-          file.mimeType ===
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        ) {
-          extractedText = await extractTextFromDOCX(buffer);
-        } else if (
-          mimeType === "text/plain" ||
-          file.mimeType === "text/plain"
-        ) {
-          extractedText = await extractTextFromTXT(buffer);
-        } else {
-          extractedText = buffer.toString("utf-8");
-        }
-
-        if (!extractedText || extractedText.trim().length < 100) {
-          continue;
-        }
-
-        // Use the service module to extract relevant sections via AI.
-        const sectionsResult = await extractStandardsSections({
-          apiKey,
-          documentText: extractedText,
-          fileName: file.name,
-          query,
-        });
-        // Service returns ok() with a single fallback sentence on gateway
-        // failure — that preserves the legacy behaviour.
-        const relevantSections = sectionsResult.ok
-          ? sectionsResult.data.sections
-          : [];
-
-        if (relevantSections.length === 0) {
-          continue;
-        }
-
-        const standardType = extractStandardType(file.name);
-
-        documentsWithSections.push({
-          name: file.name,
-          fileId: file.id,
-          relevantSections,
-          standardType,
-          extractedContent: extractedText.substring(0, 5000),
-        });
-
-        if (documentsWithSections.length >= 12) {
-          break;
-        }
-      } catch (error: any) {
-        console.error(
-          `[Standards Retrieval] Error processing file ${file.name}:`,
-          error.message,
-        );
-        continue;
+    // Extract text and relevant sections from top files. Each file is a
+    // Drive download plus a Claude call, so run a small number at once rather
+    // than strictly in sequence — bounded to avoid overwhelming either API.
+    const documentsWithSections: StandardsDocument[] = [];
+    for (let i = 0; i < topFiles.length; i += FILE_CONCURRENCY) {
+      const slice = topFiles.slice(i, i + FILE_CONCURRENCY);
+      const batch = await Promise.all(
+        slice.map((file) => extractStandardsDocument(file, apiKey, query)),
+      );
+      for (const doc of batch) {
+        if (doc) documentsWithSections.push(doc);
       }
     }
 
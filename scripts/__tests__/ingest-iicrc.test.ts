@@ -14,6 +14,9 @@ import {
   validateIngestEnv,
   assertEmbeddingShape,
   upsertChunk,
+  upsertChunks,
+  findExistingHashes,
+  ingestChunkBatch,
   parseArgs,
   parseProvenance,
   CHUNK_SIZE,
@@ -248,6 +251,158 @@ describe("upsertChunk", () => {
   });
 });
 
+describe("upsertChunks", () => {
+  const row = (content: string) => ({
+    standard: "S500",
+    edition: "2021",
+    section: "§7.1",
+    heading: "Category 2 Water",
+    content,
+    contentHash: buildContentHash("S500", "2021", content),
+    pageNumber: 1,
+    embedding: FIXED_VECTOR,
+    provenance: "AUTHORITATIVE_STANDARD" as const,
+    jurisdiction: "AU",
+  });
+
+  it("writes a whole batch in one multi-row statement", async () => {
+    const executeRawUnsafe = vi.fn().mockResolvedValue(3);
+    const mockPrisma: IicrcChunkPrisma = {
+      $executeRawUnsafe: executeRawUnsafe,
+    };
+
+    const result = await upsertChunks(mockPrisma, [
+      row("first chunk"),
+      row("second chunk"),
+      row("third chunk"),
+    ]);
+
+    expect(result).toEqual({ inserted: 3, skipped: 0 });
+    expect(executeRawUnsafe).toHaveBeenCalledTimes(1);
+    const [sql, ...values] = executeRawUnsafe.mock.calls[0];
+    expect(sql.match(/gen_random_uuid\(\)/g)).toHaveLength(3);
+    expect(sql).toContain("$30, NOW(), NOW())");
+    expect(sql).toContain('ON CONFLICT ("contentHash") DO NOTHING');
+    expect(values).toHaveLength(30);
+    expect(values[4]).toBe("first chunk");
+    expect(values[24]).toBe("third chunk");
+  });
+
+  it("counts rows that hit ON CONFLICT as skipped", async () => {
+    const executeRawUnsafe = vi.fn().mockResolvedValue(1);
+    const mockPrisma: IicrcChunkPrisma = {
+      $executeRawUnsafe: executeRawUnsafe,
+    };
+
+    const result = await upsertChunks(mockPrisma, [row("a"), row("b")]);
+
+    expect(result).toEqual({ inserted: 1, skipped: 1 });
+  });
+
+  it("does not touch the database for an empty batch", async () => {
+    const executeRawUnsafe = vi.fn();
+    const mockPrisma: IicrcChunkPrisma = {
+      $executeRawUnsafe: executeRawUnsafe,
+    };
+
+    expect(await upsertChunks(mockPrisma, [])).toEqual({
+      inserted: 0,
+      skipped: 0,
+    });
+    expect(executeRawUnsafe).not.toHaveBeenCalled();
+  });
+});
+
+// ─── findExistingHashes ───────────────────────────────────────────────────────
+
+describe("findExistingHashes", () => {
+  it("looks up every hash in one query and returns the stored ones", async () => {
+    const queryRawUnsafe = vi
+      .fn()
+      .mockResolvedValue([{ contentHash: "hash-b" }]);
+
+    const existing = await findExistingHashes(
+      { $queryRawUnsafe: queryRawUnsafe },
+      ["hash-a", "hash-b", "hash-c"],
+    );
+
+    expect([...existing]).toEqual(["hash-b"]);
+    expect(queryRawUnsafe).toHaveBeenCalledTimes(1);
+    const [sql, hashes] = queryRawUnsafe.mock.calls[0];
+    expect(sql).toContain('"contentHash" = ANY($1::text[])');
+    expect(hashes).toEqual(["hash-a", "hash-b", "hash-c"]);
+  });
+
+  it("skips the query for an empty batch", async () => {
+    const queryRawUnsafe = vi.fn();
+
+    const existing = await findExistingHashes(
+      { $queryRawUnsafe: queryRawUnsafe },
+      [],
+    );
+
+    expect(existing.size).toBe(0);
+    expect(queryRawUnsafe).not.toHaveBeenCalled();
+  });
+});
+
+// ─── ingestChunkBatch ─────────────────────────────────────────────────────────
+
+describe("ingestChunkBatch", () => {
+  const tagging = {
+    standard: "S500",
+    edition: "2021",
+    provenance: "AUTHORITATIVE_STANDARD" as const,
+    jurisdiction: "AU",
+  };
+
+  it("embeds and writes only the chunks not already stored", async () => {
+    const storedHash = buildContentHash("S500", "2021", "old chunk");
+    const queryRawUnsafe = vi
+      .fn()
+      .mockResolvedValue([{ contentHash: storedHash }]);
+    const executeRawUnsafe = vi.fn().mockResolvedValue(1);
+    const embed = vi.fn(async (texts: string[]) =>
+      texts.map(() => FIXED_VECTOR),
+    );
+
+    const result = await ingestChunkBatch(
+      { $queryRawUnsafe: queryRawUnsafe, $executeRawUnsafe: executeRawUnsafe },
+      ["old chunk", "new chunk"],
+      4,
+      tagging,
+      embed,
+    );
+
+    expect(result).toEqual({ inserted: 1, skipped: 1 });
+    expect(embed).toHaveBeenCalledWith(["new chunk"]);
+    const values = executeRawUnsafe.mock.calls[0].slice(1);
+    expect(values[4]).toBe("new chunk");
+    // Second chunk of a batch starting at offset 4 → index 5 → page 3.
+    expect(values[6]).toBe(3);
+  });
+
+  it("skips embedding and writing when every chunk is stored", async () => {
+    const queryRawUnsafe = vi.fn(async (_sql: string, hashes: string[]) =>
+      hashes.map((contentHash) => ({ contentHash })),
+    );
+    const executeRawUnsafe = vi.fn();
+    const embed = vi.fn();
+
+    const result = await ingestChunkBatch(
+      { $queryRawUnsafe: queryRawUnsafe, $executeRawUnsafe: executeRawUnsafe },
+      ["a chunk", "b chunk"],
+      0,
+      tagging,
+      embed,
+    );
+
+    expect(result).toEqual({ inserted: 0, skipped: 2 });
+    expect(embed).not.toHaveBeenCalled();
+    expect(executeRawUnsafe).not.toHaveBeenCalled();
+  });
+});
+
 // ─── parseArgs ────────────────────────────────────────────────────────────────
 
 describe("parseArgs", () => {
@@ -184,34 +184,159 @@ export interface IicrcChunkPrisma {
   $executeRawUnsafe: (query: string, ...values: unknown[]) => Promise<number>;
 }
 
+export interface IicrcChunkLookupPrisma {
+  $queryRawUnsafe: <T = unknown>(
+    query: string,
+    ...values: unknown[]
+  ) => Promise<T>;
+}
+
+/**
+ * Returns which of `hashes` are already stored, so a re-run can skip those
+ * chunks before paying for their embeddings (the ON CONFLICT in upsertChunks
+ * only stops the duplicate write, not the embedding call).
+ */
+export async function findExistingHashes(
+  prisma: IicrcChunkLookupPrisma,
+  hashes: string[],
+): Promise<Set<string>> {
+  if (hashes.length === 0) return new Set();
+  const rows = await prisma.$queryRawUnsafe<Array<{ contentHash: string }>>(
+    `SELECT "contentHash" FROM "IicrcChunk" WHERE "contentHash" = ANY($1::text[])`,
+    hashes,
+  );
+  return new Set(rows.map((r) => r.contentHash));
+}
+
+const CHUNK_COLUMNS_PER_ROW = 10;
+
+/**
+ * Upserts a batch of chunks via one multi-row `INSERT ... ON CONFLICT DO
+ * NOTHING` — a single DB round-trip per embedding batch instead of one per
+ * chunk. $executeRawUnsafe resolves to the affected row count, i.e. the number
+ * of chunks inserted; the rest already existed by contentHash and were
+ * skipped. A single statement — no separate findUnique pre-check — so there's
+ * no check-then-insert race across concurrent runs.
+ */
+export async function upsertChunks(
+  prisma: IicrcChunkPrisma,
+  rows: ChunkRow[],
+): Promise<{ inserted: number; skipped: number }> {
+  if (rows.length === 0) return { inserted: 0, skipped: 0 };
+
+  const values: unknown[] = [];
+  const tuples = rows.map((row, i) => {
+    const p = i * CHUNK_COLUMNS_PER_ROW;
+    values.push(
+      row.standard,
+      row.edition,
+      row.section,
+      row.heading,
+      row.content,
+      row.contentHash,
+      row.pageNumber,
+      `[${row.embedding.join(",")}]`,
+      row.provenance,
+      row.jurisdiction,
+    );
+    return `(gen_random_uuid()::text, $${p + 1}, $${p + 2}, $${p + 3}, $${p + 4}, $${p + 5}, $${p + 6}, $${p + 7}, $${p + 8}::vector, $${p + 9}::"ChunkProvenance", $${p + 10}, NOW(), NOW())`;
+  });
+
+  const inserted = await prisma.$executeRawUnsafe(
+    `INSERT INTO "IicrcChunk" (id, standard, edition, section, heading, content, "contentHash", "pageNumber", embedding, provenance, jurisdiction, "createdAt", "updatedAt")
+     VALUES ${tuples.join(", ")}
+     ON CONFLICT ("contentHash") DO NOTHING`,
+    ...values,
+  );
+  return { inserted, skipped: rows.length - inserted };
+}
+
 /**
- * Upserts one chunk via a single atomic `INSERT ... ON CONFLICT DO NOTHING`.
- * $executeRawUnsafe resolves to the affected row count: 0 means the
- * contentHash already existed (skipped, not re-embedded), 1 means inserted.
- * A single statement — no separate findUnique pre-check — so there's no
- * check-then-insert race across concurrent runs.
+ * Upserts one chunk (single-row form of upsertChunks). Resolves "skipped"
+ * when the contentHash already existed, "inserted" otherwise.
  */
 export async function upsertChunk(
   prisma: IicrcChunkPrisma,
   row: ChunkRow,
 ): Promise<"inserted" | "skipped"> {
-  const vectorLiteral = `[${row.embedding.join(",")}]`;
-  const affected = await prisma.$executeRawUnsafe(
-    `INSERT INTO "IicrcChunk" (id, standard, edition, section, heading, content, "contentHash", "pageNumber", embedding, provenance, jurisdiction, "createdAt", "updatedAt")
-     VALUES (gen_random_uuid()::text, $1, $2, $3, $4, $5, $6, $7, $8::vector, $9::"ChunkProvenance", $10, NOW(), NOW())
-     ON CONFLICT ("contentHash") DO NOTHING`,
-    row.standard,
-    row.edition,
-    row.section,
-    row.heading,
-    row.content,
-    row.contentHash,
-    row.pageNumber,
-    vectorLiteral,
-    row.provenance,
-    row.jurisdiction,
+  const { inserted } = await upsertChunks(prisma, [row]);
+  return inserted === 0 ? "skipped" : "inserted";
+}
+
+export interface ChunkTagging {
+  standard: string;
+  edition: string;
+  provenance: ChunkProvenance;
+  jurisdiction: string;
+}
+
+export interface PendingChunk {
+  content: string;
+  contentHash: string;
+  pageNumber: number;
+}
+
+/**
+ * Embeds one batch of chunks and writes it with a single upsertChunks call.
+ * Shared by this script, the operator ingest route and runStandardsIngest so
+ * every ingest path pays one DB round-trip per batch, not one per chunk.
+ * `embed` is injected because each caller imports lib/rag/embed dynamically.
+ */
+export async function embedAndUpsertChunks(
+  prisma: IicrcChunkPrisma,
+  chunks: PendingChunk[],
+  tagging: ChunkTagging,
+  embed: (texts: string[]) => Promise<number[][]>,
+): Promise<{ inserted: number; skipped: number }> {
+  if (chunks.length === 0) return { inserted: 0, skipped: 0 };
+
+  const embeddings = await embed(chunks.map((c) => c.content));
+  assertEmbeddingShape(embeddings, chunks.length);
+
+  const rows: ChunkRow[] = chunks.map((chunk, k) => ({
+    ...tagging,
+    ...extractSection(chunk.content),
+    content: chunk.content,
+    contentHash: chunk.contentHash,
+    pageNumber: chunk.pageNumber,
+    embedding: embeddings[k],
+  }));
+  return upsertChunks(prisma, rows);
+}
+
+/**
+ * Ingests one batch of chunk texts from a file: hashes them, skips the ones
+ * already stored (findExistingHashes), and embeds + upserts only the rest.
+ * `offset` is the batch's position in the file's chunk list, used for the
+ * approximate pageNumber. Re-running over unchanged text therefore costs one
+ * lookup per batch and no embedding calls, on every ingest path.
+ */
+export async function ingestChunkBatch(
+  prisma: IicrcChunkPrisma & IicrcChunkLookupPrisma,
+  contents: string[],
+  offset: number,
+  tagging: ChunkTagging,
+  embed: (texts: string[]) => Promise<number[][]>,
+): Promise<{ inserted: number; skipped: number }> {
+  const batch: PendingChunk[] = contents.map((content, j) => ({
+    content,
+    contentHash: buildContentHash(tagging.standard, tagging.edition, content),
+    pageNumber: Math.floor((offset + j) / 2) + 1,
+  }));
+
+  const existing = await findExistingHashes(
+    prisma,
+    batch.map((c) => c.contentHash),
   );
-  return affected === 0 ? "skipped" : "inserted";
+  const fresh = batch.filter((c) => !existing.has(c.contentHash));
+
+  const { inserted, skipped } = await embedAndUpsertChunks(
+    prisma,
+    fresh,
+    tagging,
+    embed,
+  );
+  return { inserted, skipped: skipped + batch.length - fresh.length };
 }
 
 async function embedBatchDynamic(texts: string[]): Promise<number[][]> {
@@ -285,32 +410,15 @@ async function main() {
     console.log(`  ${chunks.length} chunks`);
 
     for (let i = 0; i < chunks.length; i += BATCH) {
-      const batch = chunks.slice(i, i + BATCH);
-      const embeddings = await embedBatchDynamic(batch);
-      assertEmbeddingShape(embeddings, batch.length);
-
-      for (let j = 0; j < batch.length; j++) {
-        const content = batch[j];
-        const contentHash = buildContentHash(standard, edition, content);
-        const { section, heading } = extractSection(content);
-        const pageNumber = Math.floor((i + j) / 2) + 1;
-
-        const result = await upsertChunk(prisma, {
-          standard,
-          edition,
-          section,
-          heading,
-          content,
-          contentHash,
-          pageNumber,
-          embedding: embeddings[j],
-          provenance,
-          jurisdiction,
-        });
-
-        if (result === "inserted") summary.chunksUpserted++;
-        else summary.chunksSkipped++;
-      }
+      const { inserted, skipped } = await ingestChunkBatch(
+        prisma,
+        chunks.slice(i, i + BATCH),
+        i,
+        { standard, edition, provenance, jurisdiction },
+        embedBatchDynamic,
+      );
+      summary.chunksUpserted += inserted;
+      summary.chunksSkipped += skipped;
 
       process.stdout.write(
         `  Progress: ${Math.min(i + BATCH, chunks.length)}/${chunks.length}\r`,